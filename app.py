@@ -11,24 +11,33 @@
 #   - /tournaments/new (create form)
 #   - /tournaments/<id> (bracket + result entry, auto-advance)
 #
-# Requires: db.py helpers (get_conn, fetch_one, fetch_all, execute)
+# Requires: db.py helpers (get_conn, fetch_one, fetch_all, fetch_all_pipelined, execute, executemany, insert_many)
 # Optional: engine.py (Fighter, simulate_fight) for exhibition/sim endpoints.
 # ---------------------------------------------------------------------------------
 
 import os
+import base64
+import json
+import threading
+import time
 from pathlib import Path
+from typing import List, Optional
 
+import numpy as np
+import orjson
 from flask import (
     Flask, render_template, request, abort,
     redirect, url_for, flash, jsonify, send_from_directory
 )
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from flask_caching import Cache
 from dotenv import load_dotenv
 
 # Fight engine
 from engine import Fighter, simulate_fight
 
-# Central DB helpers (must expose: get_conn, fetch_one, fetch_all, execute)
+# Central DB helpers (must expose: get_conn, fetch_one, fetch_all, fetch_all_pipelined, execute, executemany, insert_many)
 import db
 
 # ---------------------------------------------------------------------------------
@@ -45,101 +54,227 @@ app = Flask(
 )
 app.secret_key = os.getenv("SECRET_KEY", "dev-secret-key-change-later")
 
+# JSON via orjson (C) instead of stdlib json. Dates and types orjson doesn't
+# know (e.g. Decimal) still go through Flask's default handler, so the output
+# matches what the stdlib provider produced.
+class ORJSONProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app.json = ORJSONProvider(app)
+
 # Optional CORS
 CORS(app, resources={r"/*": {
     "origins": ["https://simplesportssim.com", "https://www.simplesportssim.com"]
 }})
 
+# Short-lived in-process cache for the read-heavy list pages
+cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+LIST_CACHE_TTL = 30  # seconds
+LOOKUP_CACHE_TTL = 5  # seconds, db-level cache for dropdown/lookup lists
+
 # Dev: disable static/template caching
 if app.debug or os.getenv("FLASK_ENV") == "development":
     app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 0
     app.config["TEMPLATES_AUTO_RELOAD"] = True
 
 # Cache-busting helper you can use from templates: {{ asset('boxing.css') }}
+# File mtimes are collected once at startup so asset() is a dict lookup rather
+# than a stat() per call; in dev the map is rebuilt at most every 2 seconds.
+def _scan_asset_mtimes(root: Path) -> dict:
+    mtimes = {}
+    stack = [root] if root.is_dir() else []
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir():
+                    stack.append(Path(entry.path))
+                elif entry.is_file():
+                    rel = Path(entry.path).relative_to(root).as_posix()
+                    mtimes[rel] = int(entry.stat().st_mtime)
+    return mtimes
+
+ASSET_MTIMES = _scan_asset_mtimes(BASE_DIR / "static")
+_asset_scanned_at = time.monotonic()
+
 @app.context_processor
 def _inject_asset_helper():
+    global ASSET_MTIMES, _asset_scanned_at
+    dev = app.debug or os.getenv("FLASK_ENV") == "development"
+    if dev and time.monotonic() - _asset_scanned_at > 2.0:
+        ASSET_MTIMES = _scan_asset_mtimes(BASE_DIR / "static")
+        _asset_scanned_at = time.monotonic()
+
     def asset(filename: str):
-        try:
-            fp = BASE_DIR / "static" / filename
-            v = int(fp.stat().st_mtime)
-        except Exception:
-            v = 1
-        return url_for("static", filename=filename, v=v)
+        return url_for("static", filename=filename, v=ASSET_MTIMES.get(filename, 1))
     return {"asset": asset}
 
 # ---------------------------------------------------------------------------------
 # DASHBOARD
 # ---------------------------------------------------------------------------------
-@app.get("/")
-def dashboard():
-    classes = db.fetch_one("SELECT COUNT(*) AS count FROM boxing.weight_class")["count"]
-    titles  = db.fetch_one("SELECT COUNT(*) AS count FROM boxing.title")["count"]
-    boxers  = db.fetch_one("SELECT COUNT(*) AS count FROM boxing.boxer")["count"]
-    cards   = db.fetch_one("SELECT COUNT(*) AS count FROM boxing.boxing_card")["count"]
-
-    champions = db.fetch_all("""
+@cache.memoize(timeout=LIST_CACHE_TTL)
+def _fetch_dashboard():
+    # Counts + both views go out in a single pipelined round-trip.
+    # Counts come pre-aggregated, kept by triggers (migrations/004).
+    counts, champions, recent = db.fetch_all_pipelined(
+        """
+        SELECT MAX(n) FILTER (WHERE tbl = 'weight_class') AS classes,
+               MAX(n) FILTER (WHERE tbl = 'title')        AS titles,
+               MAX(n) FILTER (WHERE tbl = 'boxer')        AS boxers,
+               MAX(n) FILTER (WHERE tbl = 'boxing_card')  AS cards
+        FROM boxing.dashboard_counts
+        """,
+        """
         SELECT title_name, weight_class, body, boxer_id, first_name, last_name, start_date
         FROM boxing.v_current_champions
         ORDER BY weight_class, body
-    """)
-
-    recent = db.fetch_all("SELECT * FROM boxing.v_recent_bouts")
+        """,
+        "SELECT * FROM boxing.v_recent_bouts",
+    )
+    return counts[0], champions, recent
 
+@app.get("/")
+def dashboard():
+    counts, champions, recent = _fetch_dashboard()
     return render_template(
         "dashboard.html",
-        classes=classes, titles=titles, boxers=boxers, cards=cards,
+        classes=counts["classes"], titles=counts["titles"],
+        boxers=counts["boxers"], cards=counts["cards"],
         champions=champions, recent=recent
     )
 
 # ---------------------------------------------------------------------------------
 # BOXERS (Pages + Create)
 # ---------------------------------------------------------------------------------
-@app.get("/boxers")
-def boxers():
-    q = request.args.get("q", "").strip()
-    sort = (request.args.get("sort") or "last_name").lower()
-    direction = (request.args.get("dir") or "asc").lower()
+BOXERS_PAGE_SIZE = 200
 
-    SORT_MAP = {
-        "last_name": "b.last_name",
-        "first_name": "b.first_name",
-        "weight_class": "wc.name",
-        "stable": "s.name",
-        "wins": "COALESCE(r.wins,0)",
-        "losses": "COALESCE(r.losses,0)",
-        "draws": "COALESCE(r.draws,0)",
-        "ko_wins": "COALESCE(r.ko_wins,0)",
-    }
-    sort_expr = SORT_MAP.get(sort, "b.last_name")
-    dir_sql = "DESC" if direction == "desc" else "ASC"
+def _encode_cursor(values) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
 
-    base_sql = """
+def _decode_cursor(token: str, sort: str):
+    """
+    Decodes a /boxers cursor into (sort value, last_name, first_name, boxer_id).
+    The cursor also carries the sort it was issued for; a cursor for another
+    sort, or with values of the wrong type, is a 400 instead of a failed query.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = json.loads(raw)
+    except ValueError:
+        abort(400, "Invalid page cursor")
+    key_type = int if sort in BOXERS_NUMERIC_SORTS else str
+    if (not isinstance(values, list) or len(values) != 5 or values[0] != sort
+            or [type(v) for v in values[1:]] != [key_type, str, str, int]):
+        abort(400, "Invalid page cursor")
+    return tuple(values[1:])
+
+BOXERS_SORT_MAP = {
+    "last_name": "b.last_name",
+    "first_name": "b.first_name",
+    "weight_class": "wc.name",
+    "stable": "COALESCE(s.name,'')",
+    "wins": "COALESCE(r.wins,0)",
+    "losses": "COALESCE(r.losses,0)",
+    "draws": "COALESCE(r.draws,0)",
+    "ko_wins": "COALESCE(r.ko_wins,0)",
+}
+BOXERS_NUMERIC_SORTS = {"wins", "losses", "draws", "ko_wins"}
+
+def _build_boxers_sql(sort_expr: str, dir_sql: str, has_q: bool, has_after: bool) -> str:
+    base_sql = f"""
       SELECT b.boxer_id, b.first_name, b.last_name,
              wc.name AS weight_class,
              s.stable_id, s.name AS stable_name,
              COALESCE(r.wins,0) AS wins, COALESCE(r.losses,0) AS losses,
-             COALESCE(r.draws,0) AS draws, COALESCE(r.ko_wins,0) AS ko_wins
+             COALESCE(r.draws,0) AS draws, COALESCE(r.ko_wins,0) AS ko_wins,
+             {sort_expr} AS sort_key
       FROM boxing.boxer b
       JOIN boxing.weight_class wc ON wc.weight_class_id = b.weight_class_id
       LEFT JOIN boxing.stable s ON s.stable_id = b.stable_id
       LEFT JOIN boxing.v_boxer_records r ON r.boxer_id = b.boxer_id
     """
 
-    params, where = [], ""
-    if q:
-        where = """
-            WHERE LOWER(b.first_name) LIKE %s
-               OR LOWER(b.last_name)  LIKE %s
-               OR LOWER(s.name)       LIKE %s
-        """
-        like = f"%{q.lower()}%"
-        params = [like, like, like]
+    conds = []
+    if has_q:
+        # Both branches are trigram-indexed (migrations/001_boxer_search_trgm.sql)
+        conds.append("""
+            (b.search_text LIKE %s
+               OR b.stable_id = ANY(ARRAY(
+                    SELECT stable_id FROM boxing.stable
+                    WHERE LOWER(name) LIKE %s)))
+        """)
+    if has_after:
+        cmp = "<" if dir_sql == "DESC" else ">"
+        conds.append(f"""
+            ({sort_expr} {cmp} %s
+               OR ({sort_expr} = %s
+                   AND (b.last_name, b.first_name, b.boxer_id) > (%s, %s, %s)))
+        """)
+    where = " WHERE " + " AND ".join(conds) if conds else ""
 
     order_by = f" ORDER BY {sort_expr} {dir_sql}, b.last_name ASC, b.first_name ASC, b.boxer_id ASC "
-    sql = base_sql + where + order_by + " LIMIT 200"
-    rows = db.fetch_all(sql, params)
+    return base_sql + where + order_by + f" LIMIT {BOXERS_PAGE_SIZE + 1}"
+
+# Every whitelisted (sort, dir, has_q, has_after) variant is built once, so each
+# combination always sends identical text and can reuse its prepared statement.
+BOXERS_SQL = {
+    (sort, direction, has_q, has_after): _build_boxers_sql(expr, direction.upper(), has_q, has_after)
+    for sort, expr in BOXERS_SORT_MAP.items()
+    for direction in ("asc", "desc")
+    for has_q in (False, True)
+    for has_after in (False, True)
+}
+
+@cache.memoize(timeout=LIST_CACHE_TTL)
+def _fetch_boxers(q, sort, direction, after=None):
+    """
+    One page of the boxers list plus the cursor for the next page (or None).
+    Paging is keyset-based: `after` is (sort value, last_name, first_name,
+    boxer_id) of the previous page's last row, so every page is a range scan.
+    """
+    params = []
+    if q:
+        like = f"%{q.lower()}%"
+        params += [like, like]
+    if after:
+        params += [after[0], after[0], after[1], after[2], after[3]]
+
+    sql = BOXERS_SQL[(sort, direction, bool(q), bool(after))]
+    rows = db.fetch_all(sql, params, prepare=True)
+
+    next_cursor = None
+    if len(rows) > BOXERS_PAGE_SIZE:
+        rows = rows[:BOXERS_PAGE_SIZE]
+        last = rows[-1]
+        next_cursor = _encode_cursor(
+            (sort, last["sort_key"], last["last_name"], last["first_name"], last["boxer_id"])
+        )
+    return rows, next_cursor
 
-    return render_template("boxers.html", rows=rows, q=q, sort=sort, direction=direction)
+@app.get("/boxers")
+def boxers():
+    q = request.args.get("q", "").strip()
+    sort = (request.args.get("sort") or "last_name").lower()
+    direction = (request.args.get("dir") or "asc").lower()
+    if sort not in BOXERS_SORT_MAP:
+        sort = "last_name"
+    if direction != "desc":
+        direction = "asc"
+    after = request.args.get("after")
+    after = _decode_cursor(after, sort) if after else None
+
+    rows, next_cursor = _fetch_boxers(q, sort, direction, after)
+    return render_template(
+        "boxers.html", rows=rows, q=q, sort=sort, direction=direction,
+        after=after, next_cursor=next_cursor
+    )
 
 @app.get("/boxers/new")
 def boxer_new():
@@ -147,13 +282,14 @@ def boxer_new():
         SELECT weight_class_id, name
         FROM boxing.weight_class
         ORDER BY display_order, name
-    """)
+    """, cache_ttl=LOOKUP_CACHE_TTL)
+    # User-controlled stables sort first, so the default is always row 0
     stables = db.fetch_all("""
         SELECT stable_id, name, is_user_controlled
         FROM boxing.stable
-        ORDER BY name
-    """)
-    default_stable = next((s for s in stables if s["is_user_controlled"]), None)
+        ORDER BY is_user_controlled DESC, name
+    """, cache_ttl=LOOKUP_CACHE_TTL)
+    default_stable = stables[0] if stables and stables[0]["is_user_controlled"] else None
     form = {"stable_id": str(default_stable["stable_id"]) if default_stable else ""}
     return render_template("boxer_new.html", wcs=wcs, stables=stables, errors={}, form=form)
 
@@ -189,23 +325,22 @@ def boxer_create():
             errors[k] = "Enter 0–100"
 
     if errors:
-        wcs = db.fetch_all("SELECT weight_class_id, name FROM boxing.weight_class ORDER BY name")
-        stables = db.fetch_all("SELECT stable_id, name, is_user_controlled FROM boxing.stable ORDER BY name")
+        wcs = db.fetch_all("SELECT weight_class_id, name FROM boxing.weight_class ORDER BY name", cache_ttl=LOOKUP_CACHE_TTL)
+        stables = db.fetch_all("SELECT stable_id, name, is_user_controlled FROM boxing.stable ORDER BY is_user_controlled DESC, name", cache_ttl=LOOKUP_CACHE_TTL)
         return render_template("boxer_new.html", wcs=wcs, stables=stables, errors=errors, form=form), 400
 
-    # Insert boxer
-    boxer_row = db.fetch_one("""
-        INSERT INTO boxing.boxer (first_name, last_name, weight_class_id, stable_id)
-        VALUES (%s, %s, %s, %s)
-        RETURNING boxer_id
-    """, [form["first_name"], form["last_name"], form["weight_class_id"], form["stable_id"]])
-    boxer_id = boxer_row["boxer_id"]
-
-    # Insert ratings
-    db.execute("""
+    # Insert boxer + ratings in one statement (one round-trip, one transaction)
+    db.fetch_one("""
+        WITH b AS (
+            INSERT INTO boxing.boxer (first_name, last_name, weight_class_id, stable_id)
+            VALUES (%s, %s, %s, %s)
+            RETURNING boxer_id
+        )
         INSERT INTO boxing.boxer_ratings
           (boxer_id, speed, accuracy, power, defense, stamina, durability)
-        VALUES (%s,%s,%s,%s,%s,%s,%s)
+        SELECT b.boxer_id, %s::smallint, %s::smallint, %s::smallint,
+               %s::smallint, %s::smallint, %s::smallint
+        FROM b
         ON CONFLICT (boxer_id) DO UPDATE SET
           speed=EXCLUDED.speed,
           accuracy=EXCLUDED.accuracy,
@@ -213,72 +348,77 @@ def boxer_create():
           defense=EXCLUDED.defense,
           stamina=EXCLUDED.stamina,
           durability=EXCLUDED.durability
+        RETURNING boxer_id
     """, [
-        boxer_id,
+        form["first_name"], form["last_name"], form["weight_class_id"], form["stable_id"],
         int(form["speed"]), int(form["accuracy"]), int(form["power"]),
         int(form["defense"]), int(form["stamina"]), int(form["durability"])
     ])
 
+    cache.delete_memoized(_fetch_boxers)
+    cache.delete_memoized(_fetch_dashboard)
+
     flash(f"Added {form['first_name']} {form['last_name']}")
     return redirect(url_for("boxers"))
 
 # ---------------------------------------------------------------------------------
 # CARDS
 # ---------------------------------------------------------------------------------
+CARDS_SORT_MAP = {
+    "event_date": "event_date",
+    "event_name": "event_name",
+    "city": "city",
+    "country": "country",
+    "bout_count": "bout_count",
+}
+
+CARDS_SQL = {
+    (sort, direction): f"""
+        SELECT * FROM boxing.v_cards_summary
+        ORDER BY {expr} {direction.upper()}, card_id DESC
+    """
+    for sort, expr in CARDS_SORT_MAP.items()
+    for direction in ("asc", "desc")
+}
+
+@cache.memoize(timeout=LIST_CACHE_TTL)
+def _fetch_cards(sort, direction):
+    return db.fetch_all(CARDS_SQL[(sort, direction)], prepare=True)
+
 @app.get("/cards")
 def cards():
     sort = (request.args.get("sort") or "event_date").lower()
     direction = (request.args.get("dir") or "desc").lower()
+    if sort not in CARDS_SORT_MAP:
+        sort = "event_date"
+    if direction != "desc":
+        direction = "asc"
 
-    SORT_MAP = {
-        "event_date": "event_date",
-        "event_name": "event_name",
-        "city": "city",
-        "country": "country",
-        "bout_count": "bout_count",
-    }
-    sort_expr = SORT_MAP.get(sort, "event_date")
-    dir_sql = "DESC" if direction == "desc" else "ASC"
-
-    rows = db.fetch_all(f"""
-        SELECT * FROM boxing.v_cards_summary
-        ORDER BY {sort_expr} {dir_sql}, card_id DESC
-    """)
+    rows = _fetch_cards(sort, direction)
     return render_template("cards.html", cards=rows, sort=sort, direction=direction)
 
 @app.get("/cards/<int:card_id>")
 def card_detail(card_id: int):
-    card = db.fetch_one("SELECT * FROM boxing.v_cards_summary WHERE card_id = %s", [card_id])
-    if not card:
-        abort(404)
-
-    bouts = db.fetch_all("""
-      SELECT
-        bo.bout_id, bo.bout_order, bo.main_event,
-        wc.name AS weight_class, t.title_name,
-        MAX(bx.first_name || ' ' || bx.last_name) FILTER (WHERE bp.corner = 'A') AS fighter_a,
-        MAX(bx.first_name || ' ' || bx.last_name) FILTER (WHERE bp.corner = 'B') AS fighter_b,
-        MAX(bx.first_name || ' ' || bx.last_name) FILTER (WHERE bp.result = 'win') AS winner,
-        MAX(bp.method::text)                        FILTER (WHERE bp.result = 'win') AS method,
-        MAX(bp.round_ended)                         FILTER (WHERE bp.result = 'win') AS round
-      FROM boxing.bout bo
-      JOIN boxing.weight_class     wc ON wc.weight_class_id = bo.weight_class_id
-      LEFT JOIN boxing.title        t ON t.title_id = bo.title_id
-      JOIN boxing.bout_participant bp ON bp.bout_id = bo.bout_id
-      JOIN boxing.boxer            bx ON bx.boxer_id = bp.boxer_id
-      WHERE bo.card_id = %s
-      GROUP BY bo.bout_id, bo.bout_order, bo.main_event, wc.name, t.title_name
-      ORDER BY bo.bout_order
+    # Card header + all its bouts (migrations/003_v_card_bouts.sql) in one query
+    row = db.fetch_one("""
+        SELECT to_jsonb(cs) AS card,
+               (SELECT jsonb_agg(cb ORDER BY cb.bout_order)
+                FROM boxing.v_card_bouts cb
+                WHERE cb.card_id = cs.card_id) AS bouts
+        FROM boxing.v_cards_summary cs
+        WHERE cs.card_id = %s
     """, [card_id])
+    if not row:
+        abort(404)
 
-    return render_template("card_detail.html", card=card, bouts=bouts)
+    return render_template("card_detail.html", card=row["card"], bouts=row["bouts"] or [])
 
 # ---------------------------------------------------------------------------------
 # STABLES
 # ---------------------------------------------------------------------------------
-@app.get("/stables")
-def stables():
-    rows = db.fetch_all("""
+@cache.memoize(timeout=LIST_CACHE_TTL)
+def _fetch_stables():
+    return db.fetch_all("""
         SELECT
             stable_id,
             name,
@@ -288,7 +428,10 @@ def stables():
         FROM boxing.stable
         ORDER BY name;
     """)
-    return render_template("stables.html", stables=rows)
+
+@app.get("/stables")
+def stables():
+    return render_template("stables.html", stables=_fetch_stables())
 
 @app.get("/stables/<int:stable_id>")
 def stable_detail(stable_id: int):
@@ -347,6 +490,7 @@ def create_stable():
         INSERT INTO boxing.stable (name, founded_date, is_user_controlled, hq_city)
         VALUES (%s, %s, %s, %s);
     """, (name, founded_date, is_user_controlled, hq_city))
+    cache.delete_memoized(_fetch_stables)
 
     flash(f'Stable "{name}" created.', "success")
     return redirect(url_for("stables"))
@@ -371,53 +515,10 @@ def sim_fight():
     rounds = int(data.get("rounds", 12))
     seed = data.get("seed")
 
-    # Fetch fighters + ratings from DB
-    row_a = db.fetch_one("""
-        SELECT bx.boxer_id,
-               bx.first_name || ' ' || bx.last_name AS name,
-               r.speed, r.accuracy, r.power, r.defense, r.stamina, r.durability
-        FROM boxing.boxer bx
-        LEFT JOIN boxing.boxer_ratings r ON r.boxer_id = bx.boxer_id
-        WHERE bx.boxer_id = %s
-    """, [a_id])
-
-    row_b = db.fetch_one("""
-        SELECT bx.boxer_id,
-               bx.first_name || ' ' || bx.last_name AS name,
-               r.speed, r.accuracy, r.power, r.defense, r.stamina, r.durability
-        FROM boxing.boxer bx
-        LEFT JOIN boxing.boxer_ratings r ON r.boxer_id = bx.boxer_id
-        WHERE bx.boxer_id = %s
-    """, [b_id])
-
-    if not row_a or not row_b:
-        abort(400, "Invalid boxer ids")
-
-    def to_int(x, default=50):
-        try: return int(x)
-        except: return default
-
-    A = Fighter(
-        boxer_id=row_a["boxer_id"], name=row_a["name"],
-        speed=to_int(row_a.get("speed", 50)),
-        accuracy=to_int(row_a.get("accuracy", 50)),
-        power=to_int(row_a.get("power", 50)),
-        defense=to_int(row_a.get("defense", 50)),
-        stamina=to_int(row_a.get("stamina", 50)),
-        durability=to_int(row_a.get("durability", 50)),
-    )
-    B = Fighter(
-        boxer_id=row_b["boxer_id"], name=row_b["name"],
-        speed=to_int(row_b.get("speed", 50)),
-        accuracy=to_int(row_b.get("accuracy", 50)),
-        power=to_int(row_b.get("power", 50)),
-        defense=to_int(row_b.get("defense", 50)),
-        stamina=to_int(row_b.get("stamina", 50)),
-        durability=to_int(row_b.get("durability", 50)),
-    )
+    A, B = _fighters_from_db(a_id, b_id)
 
     result = simulate_fight(A, B, rounds=rounds, seed=seed)
-    return result, 200
+    return jsonify(result)
 
 # ---------------------------------------------------------------------------------
 # EXHIBITIONS (FORM + RESULT VIEW)
@@ -432,7 +533,7 @@ def exhibition_new():
         FROM boxing.boxer b
         JOIN boxing.weight_class wc ON wc.weight_class_id = b.weight_class_id
         ORDER BY b.last_name, b.first_name
-    """)
+    """, cache_ttl=LOOKUP_CACHE_TTL)
     return render_template("exhibition_new.html", boxers=boxers)
 
 @app.post("/exhibitions/simulate")
@@ -448,51 +549,12 @@ def exhibition_simulate():
         return redirect(url_for("exhibition_new"))
 
     # Fetch both fighters + ratings
-    row_a = db.fetch_one("""
-        SELECT bx.boxer_id,
-               bx.first_name || ' ' || bx.last_name AS name,
-               COALESCE(r.speed,50) AS speed,
-               COALESCE(r.accuracy,50) AS accuracy,
-               COALESCE(r.power,50) AS power,
-               COALESCE(r.defense,50) AS defense,
-               COALESCE(r.stamina,50) AS stamina,
-               COALESCE(r.durability,50) AS durability
-        FROM boxing.boxer bx
-        LEFT JOIN boxing.boxer_ratings r ON r.boxer_id = bx.boxer_id
-        WHERE bx.boxer_id = %s
-    """, [a_id])
-
-    row_b = db.fetch_one("""
-        SELECT bx.boxer_id,
-               bx.first_name || ' ' || bx.last_name AS name,
-               COALESCE(r.speed,50) AS speed,
-               COALESCE(r.accuracy,50) AS accuracy,
-               COALESCE(r.power,50) AS power,
-               COALESCE(r.defense,50) AS defense,
-               COALESCE(r.stamina,50) AS stamina,
-               COALESCE(r.durability,50) AS durability
-        FROM boxing.boxer bx
-        LEFT JOIN boxing.boxer_ratings r ON r.boxer_id = bx.boxer_id
-        WHERE bx.boxer_id = %s
-    """, [b_id])
-
-    if not row_a or not row_b:
+    A, B = _load_fighters(a_id, b_id)
+
+    if not A or not B:
         flash("Invalid fighter selection.", "error")
         return redirect(url_for("exhibition_new"))
 
-    A = Fighter(
-        boxer_id=row_a["boxer_id"], name=row_a["name"],
-        speed=int(row_a["speed"]), accuracy=int(row_a["accuracy"]),
-        power=int(row_a["power"]), defense=int(row_a["defense"]),
-        stamina=int(row_a["stamina"]), durability=int(row_a["durability"])
-    )
-    B = Fighter(
-        boxer_id=row_b["boxer_id"], name=row_b["name"],
-        speed=int(row_b["speed"]), accuracy=int(row_b["accuracy"]),
-        power=int(row_b["power"]), defense=int(row_b["defense"]),
-        stamina=int(row_b["stamina"]), durability=int(row_b["durability"])
-    )
-
     sim = simulate_fight(A, B, rounds=rounds, seed=seed)
 
     # Pass data to a result page
@@ -561,7 +623,7 @@ def tournaments_bracket(tid):
 # API: list boxers for selects (used by tournament_new.html)
 @app.get("/api/boxers")
 def api_boxers_for_tournaments():
-    rows = db.fetch_all("SELECT boxer_id, (first_name || ' ' || last_name) AS name FROM boxing.boxer ORDER BY last_name, first_name")
+    rows = db.fetch_all("SELECT boxer_id, (first_name || ' ' || last_name) AS name FROM boxing.boxer ORDER BY last_name, first_name", cache_ttl=LOOKUP_CACHE_TTL)
     return jsonify({"boxers": rows})
 
 # API: create tournament + quarterfinals
@@ -585,30 +647,20 @@ def api_create_tournament():
     tid = trow["tournament_id"]
 
     # Insert entries
-    for s in seeds:
-        db.execute(
-            "INSERT INTO boxing.tournament_boxer (tournament_id, boxer_id, seed) VALUES (%s,%s,%s)",
-            [tid, s["boxer_id"], s["seed"]]
-        )
+    db.executemany(
+        "INSERT INTO boxing.tournament_boxer (tournament_id, boxer_id, seed) VALUES (%s,%s,%s)",
+        [[tid, s["boxer_id"], s["seed"]] for s in seeds]
+    )
 
-    # Create QFs: (1-8), (4-5), (3-6), (2-7)
+    # Create QFs: (1-8), (4-5), (3-6), (2-7) — one multi-row INSERT
+    by_seed = {s["seed"]: s["boxer_id"] for s in seeds}
     pairs = [(1,8),(4,5),(3,6),(2,7)]
-    for i,(a,b) in enumerate(pairs, start=1):
-        b1 = db.fetch_one(
-            "SELECT boxer_id FROM boxing.tournament_boxer WHERE tournament_id=%s AND seed=%s",
-            [tid,a]
-        )["boxer_id"]
-        b2 = db.fetch_one(
-            "SELECT boxer_id FROM boxing.tournament_boxer WHERE tournament_id=%s AND seed=%s",
-            [tid,b]
-        )["boxer_id"]
-        db.execute(
-            """
-            INSERT INTO boxing.matches (tournament_id, round, bout_no, boxer1_id, boxer2_id, is_official)
-            VALUES (%s, 1, %s, %s, %s, %s)
-            """,
-            [tid, i, b1, b2, not is_exhibition]
-        )
+    db.insert_many(
+        "boxing.matches",
+        ["tournament_id", "round", "bout_no", "boxer1_id", "boxer2_id", "is_official"],
+        [[tid, 1, i, by_seed[a], by_seed[b], not is_exhibition]
+         for i,(a,b) in enumerate(pairs, start=1)]
+    )
 
     return jsonify({"tournament_id": tid})
 
@@ -679,28 +731,86 @@ def api_save_result(match_id):
     return jsonify({"ok": True})
 
 # --- Helpers to build Fighter objects from DB ---
-def _fighter_from_db(boxer_id: int) -> Fighter:
-    row = db.fetch_one("""
-        SELECT bx.boxer_id,
-               bx.first_name || ' ' || bx.last_name AS name,
-               COALESCE(r.speed,50) AS speed,
-               COALESCE(r.accuracy,50) AS accuracy,
-               COALESCE(r.power,50) AS power,
-               COALESCE(r.defense,50) AS defense,
-               COALESCE(r.stamina,50) AS stamina,
-               COALESCE(r.durability,50) AS durability
-        FROM boxing.boxer bx
-        LEFT JOIN boxing.boxer_ratings r ON r.boxer_id = bx.boxer_id
-        WHERE bx.boxer_id = %s
-    """, [boxer_id])
-    if not row:
-        abort(400, f"Invalid boxer_id {boxer_id}")
-    return Fighter(
-        boxer_id=row["boxer_id"], name=row["name"],
-        speed=int(row["speed"]), accuracy=int(row["accuracy"]),
-        power=int(row["power"]), defense=int(row["defense"]),
-        stamina=int(row["stamina"]), durability=int(row["durability"])
-    )
+# Ratings are kept structure-of-arrays: one int8 array per attribute, indexed
+# by boxer_id and filled by a single query on first use. Names sit alongside
+# in a dict. Fighters are built from these on demand; ids that are missing
+# (e.g. boxers created by another worker) are fetched together in one query.
+# Ratings change in place (boxer_ratings.updated_at), so a requested boxer
+# whose entry is older than RATINGS_TTL is re-fetched by primary key.
+# Queries run outside the lock; it only guards reading and swapping entries.
+RATING_FIELDS = ("speed", "accuracy", "power", "defense", "stamina", "durability")
+RATINGS_TTL = 60  # seconds
+_RATINGS = {}   # field -> np.ndarray[int8] indexed by boxer_id
+_NAMES = {}     # boxer_id -> "First Last"
+_LOADED_AT = {} # boxer_id -> time.monotonic() of its last fetch
+_RATINGS_WARM = False
+_RATINGS_LOCK = threading.Lock()
+
+_RATINGS_SQL = """
+    SELECT bx.boxer_id,
+           bx.first_name || ' ' || bx.last_name AS name,
+           COALESCE(r.speed,50) AS speed,
+           COALESCE(r.accuracy,50) AS accuracy,
+           COALESCE(r.power,50) AS power,
+           COALESCE(r.defense,50) AS defense,
+           COALESCE(r.stamina,50) AS stamina,
+           COALESCE(r.durability,50) AS durability
+    FROM boxing.boxer bx
+    LEFT JOIN boxing.boxer_ratings r ON r.boxer_id = bx.boxer_id
+"""
+
+def _store_ratings(rows, fetched_at: float) -> None:
+    """Copy rating rows into the SoA arrays (growing them as needed). Caller holds the lock."""
+    if not rows:
+        return
+    size = max(r["boxer_id"] for r in rows) + 1
+    ids = np.fromiter((r["boxer_id"] for r in rows), dtype=np.intp, count=len(rows))
+    for f in RATING_FIELDS:
+        arr = _RATINGS.get(f)
+        if arr is None or len(arr) < size:
+            grown = np.zeros(size, dtype=np.int8)
+            if arr is not None:
+                grown[:len(arr)] = arr
+            _RATINGS[f] = arr = grown
+        arr[ids] = np.fromiter((r[f] for r in rows), dtype=np.int8, count=len(rows))
+    _NAMES.update((r["boxer_id"], r["name"]) for r in rows)
+    _LOADED_AT.update((r["boxer_id"], fetched_at) for r in rows)
+
+def _load_fighters(*boxer_ids: int) -> List[Optional[Fighter]]:
+    """Fighters + ratings for the given boxers, in order (None where unknown)."""
+    global _RATINGS_WARM
+    now = time.monotonic()
+    with _RATINGS_LOCK:
+        warm = _RATINGS_WARM
+        stale = [i for i in boxer_ids if i not in _LOADED_AT or now - _LOADED_AT[i] > RATINGS_TTL]
+
+    rows = None
+    if not warm:
+        rows = db.fetch_all(_RATINGS_SQL)
+    elif stale:
+        rows = db.fetch_all(_RATINGS_SQL + " WHERE bx.boxer_id = ANY(%s)", [stale])
+
+    with _RATINGS_LOCK:
+        if rows is not None:
+            _store_ratings(rows, now)
+            _RATINGS_WARM = True
+            for i in set(stale).difference(r["boxer_id"] for r in rows):
+                _NAMES.pop(i, None)  # deleted since it was cached
+                _LOADED_AT.pop(i, None)
+        return [
+            Fighter(
+                boxer_id=i, name=_NAMES[i],
+                **{f: int(_RATINGS[f][i]) for f in RATING_FIELDS}
+            ) if i in _NAMES else None
+            for i in boxer_ids
+        ]
+
+def _fighters_from_db(*boxer_ids: int) -> List[Fighter]:
+    fighters = _load_fighters(*boxer_ids)
+    for boxer_id, fighter in zip(boxer_ids, fighters):
+        if not fighter:
+            abort(400, f"Invalid boxer_id {boxer_id}")
+    return fighters
 
 def _method_from_engine_result(res: dict) -> (str, int):
     """Map engine result to (method, rounds)."""
@@ -735,8 +845,7 @@ def api_simulate_match(match_id: int):
     seed = data.get("seed")
     seed = int(seed) if isinstance(seed, int) else None
 
-    A = _fighter_from_db(m["boxer1_id"])
-    B = _fighter_from_db(m["boxer2_id"])
+    A, B = _fighters_from_db(m["boxer1_id"], m["boxer2_id"])
 
     sim = simulate_fight(A, B, rounds=12, seed=seed)  # uses your engine
     if not sim.get("winner"):
@@ -847,13 +956,28 @@ def api_simulate_all(tid: int):
 # ---------------------------------------------------------------------------------
 # Health / Static Debug
 # ---------------------------------------------------------------------------------
+HEALTH_TTL = 10.0  # seconds a good check is trusted for
+_last_ok_at = 0.0
+
 @app.get("/healthz")
 def healthz():
+    # Probes hit this every few seconds; answer from the last good check
+    # and only touch Postgres once that is stale.
+    global _last_ok_at
+    now = time.monotonic()
+    if now - _last_ok_at < HEALTH_TTL:
+        return {"status": "ok"}, 200
     try:
-        with db.get_conn() as conn, conn.cursor() as cur:
-            cur.execute("SELECT 1")
-            return {"status": "ok"}, 200
+        # Pings the idle pooled connections, replacing any broken ones
+        db.POOL.check()
+        if not db.POOL.get_stats().get("pool_available"):
+            # Nothing idle was verified: borrow one and ask directly
+            with db.POOL.connection(timeout=5.0) as conn:
+                conn.execute("SELECT 1")
+        _last_ok_at = now
+        return {"status": "ok"}, 200
     except Exception as e:
+        _last_ok_at = 0.0
         return {"status": "error", "detail": str(e)}, 500
 
 @app.get("/_debug/static")
@@ -1,8 +1,15 @@
 # db.py (CORRECTED)
 
 import os
-import psycopg
+import re
+import atexit
+import threading
+from contextlib import contextmanager
+from itertools import islice
+from cachetools import TLRUCache
+from psycopg import sql as pgsql
 from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -11,14 +18,14 @@ load_dotenv()
 # Look for the *variable* named "DATABASE_URL"
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-def get_conn():
+def _conninfo():
     """
-    Creates and returns a new database connection.
+    Returns the connection string for the pool.
     It uses the DATABASE_URL from the environment for production (on Render)
     or falls back to individual PG* vars for local development.
     """
     conn_string = DATABASE_URL
-    
+
     # If DATABASE_URL is not set, build the string for local dev
     if not conn_string:
         conn_string = (
@@ -29,31 +36,225 @@ def get_conn():
             f"password={os.getenv('PGPASSWORD')}" # Get local pw from .env
         )
 
-    return psycopg.connect(conn_string, row_factory=dict_row)
+    return conn_string
+
+def _prepare_threshold():
+    """
+    DB_PREPARE_THRESHOLD: executions before a query is prepared server-side
+    (default 0 = on first use); "none" disables server-side prepares, e.g.
+    behind a transaction-mode pooler that can't keep them.
+    """
+    value = os.getenv("DB_PREPARE_THRESHOLD", "0").strip().lower()
+    return None if value == "none" else int(value)
+
+def _configure(conn):
+    # Keep up to DB_PREPARED_MAX prepared statements per pooled connection
+    conn.prepared_max = int(os.getenv("DB_PREPARED_MAX", "200"))
 
+# One pool per process: connections stay open between requests instead of
+# paying the TCP + TLS + auth handshake on every query.
+# By default every statement is prepared on first use, so repeated
+# queries skip parse/plan for the lifetime of the pooled connection.
+# Sized from DB_POOL_MIN / DB_POOL_MAX. An explicit DB_POOL_MAX always wins,
+# so workers * DB_POOL_MAX can be kept within the database's connection
+# limit. Otherwise max defaults to ~2x CPU cores, or under gunicorn to
+# DB_POOL_MAX_DEFAULT, which post_fork (gunicorn.conf.py) sets per worker.
+POOL_MIN = int(os.getenv("DB_POOL_MIN", "2"))
+POOL_MAX = max(POOL_MIN, int(os.getenv(
+    "DB_POOL_MAX", os.getenv("DB_POOL_MAX_DEFAULT", str(2 * (os.cpu_count() or 1)))
+)))
 
-def fetch_all(sql, params=None):
+POOL = ConnectionPool(
+    _conninfo(),
+    min_size=POOL_MIN,
+    max_size=POOL_MAX,
+    kwargs={"row_factory": dict_row, "prepare_threshold": _prepare_threshold()},
+    configure=_configure,
+    open=True,
+)
+atexit.register(POOL.close)
+
+@contextmanager
+def get_conn():
+    """
+    Borrows a connection from the pool (use as a context manager).
+    The transaction is committed on a clean exit and the connection
+    is returned to the pool afterwards.
+    """
+    with POOL.connection() as conn:
+        yield conn
+
+
+# In-process result cache for hot read queries, keyed on (sql, params).
+# Entries live for the cache_ttl (seconds) given by the caller; any write
+# through this module drops the entries whose SQL mentions the written table.
+_CACHE = TLRUCache(maxsize=2048, ttu=lambda _key, value, now: now + value[0])
+_CACHE_LOCK = threading.Lock()
+# UPDATE(?!\s+SET) skips the "DO UPDATE SET" of an ON CONFLICT clause.
+_WRITE_TABLE_RE = re.compile(
+    r"\b(?:INSERT\s+INTO|UPDATE(?!\s+SET\b)|DELETE\s+FROM)\s+([\w.]+)", re.IGNORECASE
+)
+# Cheap anchored check so plain SELECTs through fetch_* skip the scan above
+_WRITE_STMT_RE = re.compile(r"\s*(?:WITH|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+
+def _invalidate(sql):
+    """Drops cached results that read any table written by `sql`."""
+    if isinstance(sql, str):
+        _invalidate_tables(_WRITE_TABLE_RE.findall(sql))
+
+def _invalidate_if_write(sql):
+    """_invalidate for fetch_* calls, which are mostly reads."""
+    if isinstance(sql, str) and _WRITE_STMT_RE.match(sql):
+        _invalidate(sql)
+
+def _invalidate_tables(tables):
+    if not tables:
+        return
+    # Whole identifiers only: "boxing.boxer" must not hit boxing.boxer_ratings
+    mentions = re.compile(
+        r"(?<!\w)(?:%s)(?!\w)" % "|".join(re.escape(t) for t in tables), re.IGNORECASE
+    ).search
+    with _CACHE_LOCK:
+        for key in [k for k in _CACHE if mentions(k[0])]:
+            _CACHE.pop(key, None)
+
+def _cached(fetch, sql, params, cache_ttl):
+    key = (sql, repr(params), fetch.__name__)
+    with _CACHE_LOCK:
+        hit = _CACHE.get(key)
+    if hit is not None:
+        return hit[1]
+    result = fetch()
+    with _CACHE_LOCK:
+        _CACHE[key] = (cache_ttl, result)
+    return result
+
+def fetch_all(sql, params=None, prepare=None, cache_ttl=0):
     """
     Executes a SQL query and returns ALL results as a list of dicts.
+    Pass prepare=True to use a server-side prepared statement right away,
+    and cache_ttl=<seconds> to serve repeats from the in-process cache.
+    """
+    def _fetch_all():
+        with get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, params, prepare=prepare)
+                return cur.fetchall()
+
+    if cache_ttl > 0:
+        return _cached(_fetch_all, sql, params, cache_ttl)
+    rows = _fetch_all()
+    _invalidate_if_write(sql)
+    return rows
+
+def fetch_one(sql, params=None, prepare=None, cache_ttl=0):
+    """
+    Executes a SQL query and returns ONE result as a dict.
+    Pass prepare=True to use a server-side prepared statement right away,
+    and cache_ttl=<seconds> to serve repeats from the in-process cache.
+    """
+    def _fetch_one():
+        with get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, params, prepare=prepare)
+                return cur.fetchone()
+
+    if cache_ttl > 0:
+        return _cached(_fetch_one, sql, params, cache_ttl)
+    row = _fetch_one()
+    _invalidate_if_write(sql)  # INSERT ... RETURNING goes through here too
+    return row
+
+def execute(sql, params=None):
+    """
+    Executes a SQL command (INSERT, UPDATE, DELETE) and commits the change.
     """
     with get_conn() as conn:
         with conn.cursor() as cur:
             cur.execute(sql, params)
-            return cur.fetchall()
+    _invalidate(sql)
 
-def fetch_one(sql, params=None):
+def fetch_all_pipelined(*queries):
     """
-    Executes a SQL query and returns ONE result as a dict.
+    Runs several SELECTs on one connection in pipeline mode and returns
+    their results as a list of lists of dicts (one list per query).
+    Each query is either a SQL string or a (sql, params) tuple.
+    """
+    with get_conn() as conn:
+        cursors = []
+        with conn.pipeline():
+            for q in queries:
+                sql, params = q if isinstance(q, tuple) else (q, None)
+                cur = conn.cursor()
+                cur.execute(sql, params)
+                cursors.append(cur)
+        return [cur.fetchall() for cur in cursors]
+
+def executemany(sql, param_list):
+    """
+    Executes one SQL command for every params entry and commits once.
+    Binds are streamed in pipeline mode behind a single Sync instead of
+    one round-trip per row (statements are prepared, see POOL).
+    Returns the total number of rows affected.
     """
     with get_conn() as conn:
         with conn.cursor() as cur:
-            cur.execute(sql, params)
-            return cur.fetchone()
+            with conn.pipeline():
+                cur.executemany(sql, param_list, returning=False)
+            rowcount = cur.rowcount
+    _invalidate(sql)
+    return rowcount
 
-def execute(sql, params=None):
+def insert_many(table, columns, rows, page_size=1000):
     """
-    Executes a SQL command (INSERT, UPDATE, DELETE) and commits the change.
+    Inserts rows with multi-row INSERT ... VALUES (...), (...) statements,
+    `page_size` rows per statement, all in one transaction.
+    `table` may be schema-qualified ("boxing.matches").
+    Returns the number of rows inserted.
+    """
+    # Postgres caps one statement at 65535 bind parameters.
+    page_size = max(1, min(page_size, 65535 // len(columns)))
+    head = pgsql.SQL("INSERT INTO {} ({}) VALUES ").format(
+        pgsql.Identifier(*table.split(".")),
+        pgsql.SQL(", ").join(pgsql.Identifier(c) for c in columns),
+    )
+    row_tmpl = pgsql.SQL("({})").format(
+        pgsql.SQL(", ").join(pgsql.Placeholder() * len(columns))
+    )
+    total = 0
+    it = iter(rows)
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            while True:
+                chunk = list(islice(it, page_size))
+                if not chunk:
+                    break
+                stmt = head + pgsql.SQL(", ").join([row_tmpl] * len(chunk))
+                cur.execute(stmt, [v for row in chunk for v in row])
+                total += cur.rowcount
+    _invalidate_tables([table])
+    return total
+
+def copy_rows(table, columns, rows_iter, types=None):
+    """
+    Bulk-loads rows with COPY ... FROM STDIN (one streamed command instead
+    of one INSERT per row). `table` may be schema-qualified ("boxing.boxer").
+    Pass Postgres type names in `types` (e.g. ["int4", "text"]) to use the
+    binary format; otherwise the text format is used.
+    Returns the number of rows copied.
     """
+    stmt = pgsql.SQL("COPY {} ({}) FROM STDIN{}").format(
+        pgsql.Identifier(*table.split(".")),
+        pgsql.SQL(", ").join(pgsql.Identifier(c) for c in columns),
+        pgsql.SQL(" WITH (FORMAT BINARY)" if types else ""),
+    )
     with get_conn() as conn:
         with conn.cursor() as cur:
-            cur.execute(sql, params)
\ No newline at end of file
+            with cur.copy(stmt) as cp:
+                if types:
+                    cp.set_types(types)
+                for row in rows_iter:
+                    cp.write_row(row)
+            rowcount = cur.rowcount
+    _invalidate_tables([table])
+    return rowcount
@@ -1,9 +1,12 @@
 # engine.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Tuple
-import math, random
+import math, os, zlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import numpy as np
 
-@dataclass
+@dataclass(frozen=True)
 class Fighter:
     boxer_id: int
     name: str
@@ -14,51 +17,197 @@ class Fighter:
     stamina: int       # 0-100
     durability: int    # 0-100
 
+@dataclass
+class PlayByPlay:
+    """
+    Round-by-round log stored by column: one array slot per scheduled round,
+    filled up to len(self). Notes and judge cards stay as lists of strings.
+    """
+    landed_a: np.ndarray
+    landed_b: np.ndarray
+    kd_a: np.ndarray
+    kd_b: np.ndarray
+    notes: List[List[str]] = field(default_factory=list)
+    judge_scores: List[List[str]] = field(default_factory=list)
+    stopped: bool = False  # last recorded round ended the fight
+
+    @classmethod
+    def for_rounds(cls, rounds: int) -> "PlayByPlay":
+        # rounds <= 0 plays no rounds (a 0-0 draw), so size the log to match
+        return cls(*(np.zeros(max(0, rounds), dtype=np.int16) for _ in range(4)))
+
+    def __len__(self) -> int:
+        return len(self.notes)
+
+    def record(self, landed_a: int, landed_b: int, kd_a: int, kd_b: int,
+               notes: List[str], judge_scores: List[str]) -> None:
+        i = len(self.notes)
+        self.landed_a[i] = landed_a
+        self.landed_b[i] = landed_b
+        self.kd_a[i] = kd_a
+        self.kd_b[i] = kd_b
+        self.notes.append(notes)
+        self.judge_scores.append(judge_scores)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """The list-of-dicts shape returned by simulate_fight."""
+        n = len(self)
+        landed_a, landed_b = self.landed_a[:n].tolist(), self.landed_b[:n].tolist()
+        kd_a, kd_b = self.kd_a[:n].tolist(), self.kd_b[:n].tolist()
+        rows: List[Dict[str, Any]] = []
+        for i in range(n):
+            row: Dict[str, Any] = {"round": i + 1}
+            if self.stopped and i == n - 1:
+                row["stoppage"] = True
+            row.update(landed_a=landed_a[i], landed_b=landed_b[i], kd_a=kd_a[i], kd_b=kd_b[i],
+                       notes=self.notes[i], judge_scores=self.judge_scores[i])
+            rows.append(row)
+        return rows
+
 # -------- Helpers --------
 
+def _make_rng(seed: Optional[Any]) -> np.random.Generator:
+    """PCG64 Generator for a fight; any int (or str) seed is reproducible."""
+    if seed is not None:
+        seed = seed & 0xFFFFFFFFFFFFFFFF if isinstance(seed, int) else zlib.crc32(str(seed).encode())
+    return np.random.Generator(np.random.PCG64(seed))
+
 def _sigmoid(x: float) -> float:
     return 1.0 / (1.0 + math.exp(-x))
 
+def _hit_chance(x: float) -> float:
+    """sigmoid(x) clamped to [0.15, 0.75]; skips exp outside logit(0.15)..logit(0.75)."""
+    if x > 1.1:
+        return 0.75
+    if x < -1.74:
+        return 0.15
+    return max(0.15, min(0.75, _sigmoid(x)))
+
 def _pct(x: int) -> float:
     # map 0..100 -> 0.0..1.0 (clamp)
     return max(0.0, min(1.0, x / 100.0))
 
+# Every possible judge card, formatted once: points only range 7..10
+_CARDS = {(a, b): f"{a}-{b}" for a in range(7, 11) for b in range(7, 11)}
+
 def _score_round(landed_a: int, landed_b: int, kd_a: int, kd_b: int, judge_bias: float = 0.0) -> Tuple[int, int]:
     """
     Return (a_points, b_points) for one judge in a single round.
     judge_bias >0 leans toward A a tiny bit, <0 toward B.
     """
+    # Branchless: predicates count as 0/1, so 10-9, 9-10 or an even 10-10
     margin = (landed_a - landed_b) + judge_bias
-    if margin > 0.5:
-        a, b = 10, 9
-    elif margin < -0.5:
-        a, b = 9, 10
-    else:
-        a = 10
-        b = 10  # even round
+    a = 10 - (margin < -0.5)
+    b = 10 - (margin > 0.5)
 
     # Knockdowns modify scoring (10-8 typical, 10-7 for two)
-    if kd_a >= 1 and a >= b:
-        b = max(7, b - kd_a)
-    if kd_b >= 1 and b >= a:
-        a = max(7, a - kd_b)
+    b = max(7, b - kd_a * (a >= b))
+    a = max(7, a - kd_b * (b >= a))
 
     # If the loser scored a KD, keep losses reasonable
-    if kd_a >= 1 and b > a:
-        b = max(9, b)
-    if kd_b >= 1 and a > b:
-        a = max(9, a)
-
+    b = max(b, 9 * (kd_a >= 1 and b > a))
+    a = max(a, 9 * (kd_b >= 1 and a > b))
     return a, b
 
+# -------- Round scan --------
+# Both scans below walk a round's attempt draws U (see simulate_fight) from
+# `start` and stop at the first landed punch whose knockdown/knockout roll
+# lands under kd_prob + ko_prob. They return (index, damage_a, damage_b, landed_a, landed_b) with
+# damage and landed counts including that punch (index == len(U) if none).
+# The arithmetic is written in the same order in both so they agree bit for
+# bit; the compiled one is used when numba is installed.
+
+def _next_event_scalar(U: np.ndarray, start: int, a_att_prob: float, hit_a: float, hit_b: float,
+                       pow_a: float, pow_b: float, def_a: float, def_b: float,
+                       fatigue_a: float, fatigue_b: float, damage_a: float, damage_b: float
+                       ) -> Tuple[int, float, float, int, int]:
+    # Round constants: only the draws and the running damage vary per punch
+    atk_a, def_term_b, fat_mult_a = 2.5 * pow_a, 3.5 * def_b, 1.0 + 0.15 * (1.0 - fatigue_a)
+    atk_b, def_term_a, fat_mult_b = 2.5 * pow_b, 3.5 * def_a, 1.0 + 0.15 * (1.0 - fatigue_b)
+    kd_base_a, ko_base_a = 0.001 + 0.0015 * pow_a, 0.0001 + 0.0015 * pow_a
+    kd_base_b, ko_base_b = 0.001 + 0.0015 * pow_b, 0.0001 + 0.0015 * pow_b
+
+    landed_a = 0
+    landed_b = 0
+    for i in range(start, U.shape[0]):
+        if U[i, 0] < a_att_prob:
+            if U[i, 1] < hit_a:
+                landed_a += 1
+                dmg = (0.5 + atk_a * (0.6 + 0.8 * U[i, 2]) - def_term_b) * fat_mult_a * (0.95 + 0.10 * U[i, 3])
+                damage_b += max(0.5, dmg)
+                kd_prob = kd_base_a + 0.0008 * max(0.0, (damage_b - 75.0) / 75.0)
+                ko_prob = ko_base_a + 0.0008 * max(0.0, (damage_b - 90.0) / 60.0)
+                if U[i, 4] < kd_prob + ko_prob:
+                    return i, damage_a, damage_b, landed_a, landed_b
+        elif U[i, 1] < hit_b:
+            landed_b += 1
+            dmg = (0.5 + atk_b * (0.6 + 0.8 * U[i, 2]) - def_term_a) * fat_mult_b * (0.95 + 0.10 * U[i, 3])
+            damage_a += max(0.5, dmg)
+            kd_prob = kd_base_b + 0.0008 * max(0.0, (damage_a - 75.0) / 75.0)
+            ko_prob = ko_base_b + 0.0008 * max(0.0, (damage_a - 90.0) / 60.0)
+            if U[i, 4] < kd_prob + ko_prob:
+                return i, damage_a, damage_b, landed_a, landed_b
+    return U.shape[0], damage_a, damage_b, landed_a, landed_b
+
+def _next_event_numpy(U: np.ndarray, start: int, a_att_prob: float, hit_a: float, hit_b: float,
+                      pow_a: float, pow_b: float, def_a: float, def_b: float,
+                      fatigue_a: float, fatigue_b: float, damage_a: float, damage_b: float
+                      ) -> Tuple[int, float, float, int, int]:
+    if start >= len(U):
+        return len(U), damage_a, damage_b, 0, 0
+    U = U[start:]
+    attacker_is_a = U[:, 0] < a_att_prob
+    landed = U[:, 1] < np.where(attacker_is_a, hit_a, hit_b)
+    landed_by_a = attacker_is_a & landed
+    landed_by_b = ~attacker_is_a & landed
+
+    # --- FINAL TUNE: Damage (Reduced) & Defense (Increased) ---
+    dmg_by_a = (0.5 + 2.5 * pow_a * (0.6 + 0.8 * U[:, 2]) - 3.5 * def_b) * (1.0 + 0.15 * (1.0 - fatigue_a)) * (0.95 + 0.10 * U[:, 3])
+    dmg_by_b = (0.5 + 2.5 * pow_b * (0.6 + 0.8 * U[:, 2]) - 3.5 * def_a) * (1.0 + 0.15 * (1.0 - fatigue_b)) * (0.95 + 0.10 * U[:, 3])
+    # Every landed punch does at least 0.5; the running totals start from
+    # the current damage so they accumulate in the same order as a loop.
+    cum_b = np.cumsum(np.concatenate(([damage_b], np.where(landed_by_a, np.maximum(0.5, dmg_by_a), 0.0))))[1:]
+    cum_a = np.cumsum(np.concatenate(([damage_a], np.where(landed_by_b, np.maximum(0.5, dmg_by_b), 0.0))))[1:]
+    dmg_def = np.where(attacker_is_a, cum_b, cum_a)
+    pow_att = np.where(attacker_is_a, pow_a, pow_b)
+
+    # --- Per-punch probabilities (from first fix) ---
+    kd_prob = 0.001 + 0.0015 * pow_att + 0.0008 * np.maximum(0.0, (dmg_def - 75.0) / 75.0)
+    ko_prob = 0.0001 + 0.0015 * pow_att + 0.0008 * np.maximum(0.0, (dmg_def - 90.0) / 60.0)
+    event = landed & (U[:, 4] < kd_prob + ko_prob)
+
+    k = int(event.argmax()) if event.any() else len(U) - 1
+    return (start + k if event[k] else start + len(U),
+            float(cum_a[k]), float(cum_b[k]),
+            int(landed_by_a[:k + 1].sum()), int(landed_by_b[:k + 1].sum()))
+
+try:
+    from numba import njit
+    _next_event = njit(cache=True)(_next_event_scalar)
+except ImportError:  # numba is optional; NumPy gives the same results
+    _next_event = _next_event_numpy
+
 # -------- Engine Core --------
 
-def simulate_fight(a: Fighter, b: Fighter, rounds: int = 12, seed: Optional[int] = None) -> Dict[str, Any]:
+def simulate_fight(a: Fighter, b: Fighter, rounds: int = 12, seed: Optional[int] = None,
+                   columnar: bool = False, record_notes: bool = True) -> Dict[str, Any]:
     """
     Simulate a boxing match between fighters a and b.
     Returns a dict with result, scorecards, totals, and play_by_play.
+    play_by_play is a list of per-round dicts, or the PlayByPlay itself
+    when columnar=True (cheaper for callers that only need a few columns).
+    record_notes=False leaves notes and judge cards empty, for callers that
+    only want the outcome; the fight itself plays out the same.
     """
-    rng = random.Random(seed)
+    result = _simulate_fight(a, b, rounds, seed, record_notes)
+    del result["winner_side"]  # internal: 0 = A, 1 = B, None = draw (see _simulate_chunk)
+    if not columnar:
+        result["play_by_play"] = result["play_by_play"].to_dicts()
+    return result
+
+def _simulate_fight(a: Fighter, b: Fighter, rounds: int, seed: Optional[int],
+                    record_notes: bool) -> Dict[str, Any]:
+    rng = _make_rng(seed)
 
     # Derived modifiers (normalize 0..1)
     spd_a, spd_b = _pct(a.speed), _pct(b.speed)
@@ -69,127 +218,121 @@ def simulate_fight(a: Fighter, b: Fighter, rounds: int = 12, seed: Optional[int]
     dur_a, dur_b = _pct(a.durability), _pct(b.durability)
 
     # State
-    damage_a = 0.0  # accumulated damage TO A
-    damage_b = 0.0  # accumulated damage TO B
+    # Two-slot state is indexed 0 = A, 1 = B
+    damage: List[float] = [0.0, 0.0]  # accumulated damage TO each fighter
     fatigue_a = 0.0
     fatigue_b = 0.0
-    kd_total_a = 0  # knockdowns suffered BY A
-    kd_total_b = 0
+    kd_total: List[int] = [0, 0]  # knockdowns suffered BY each fighter
 
-    judges = [[0, 0], [0, 0], [0, 0]]  # three judges total points [[A,B], ...]
-    pbp: List[Dict[str, Any]] = []
+    # Judges' running totals for A and B (all three judges agree, see below)
+    total_a = total_b = 0
+    pbp = PlayByPlay.for_rounds(rounds)
 
     # --- FINAL TUNE: TKO Thresholds (Increased) ---
     ko_threshold_a = 400.0 * (1.0 - dur_a) + 350.0 # Was 350 / 300
     ko_threshold_b = 400.0 * (1.0 - dur_b) + 350.0 # Was 350 / 300
+    ko_threshold = (ko_threshold_a, ko_threshold_b)
+    # Lowest damage that can still end it after a knockdown (roll 0.85..0.95)
+    tko_floor = (ko_threshold_a * 0.85, ko_threshold_b * 0.85)
+    fighters = (a, b)
+    power = (pow_a, pow_b)
+
+    # Per-fight constants: attempt volume before fatigue, and recovery
+    # between rounds, only depend on the fighters' ratings.
+    base_exchange = 48 + int(32 * (spd_a + spd_b) / 2)
+    volume_a = base_exchange * (0.50 + 0.5 * spd_a) * (0.65 + 0.35 * sta_a)
+    volume_b = base_exchange * (0.50 + 0.5 * spd_b) * (0.65 + 0.35 * sta_b)
+    fatigue_recovery_a = 0.01 + 0.03 * sta_a
+    fatigue_recovery_b = 0.01 + 0.03 * sta_b
+    next_event = _next_event
 
     # Per-round loop
     for rnd in range(1, rounds + 1):
         # Attempt counts influenced by speed, stamina, fatigue
-        base_exchange = 48 + int(32 * (spd_a + spd_b) / 2)
-        attempts_a = max(10, int(base_exchange * (0.50 + 0.5 * spd_a) * (0.65 + 0.35 * sta_a) * (1.0 - 0.35 * fatigue_a)))
-        attempts_b = max(10, int(base_exchange * (0.50 + 0.5 * spd_b) * (0.65 + 0.35 * sta_b) * (1.0 - 0.35 * fatigue_b)))
+        attempts_a = max(10, int(volume_a * (1.0 - 0.35 * fatigue_a)))
+        attempts_b = max(10, int(volume_b * (1.0 - 0.35 * fatigue_b)))
 
         landed_a = 0
         landed_b = 0
-        kd_a = 0
-        kd_b = 0
+        kd: List[int] = [0, 0]  # knockdowns scored BY each fighter this round
         notes: List[str] = []
 
-        # Each attempt: decide attacker by current freshness
+        # All attempts of the round are drawn and resolved as arrays.
+        # Fatigue only changes between rounds, so who attacks and the hit
+        # chances are per-round constants. Columns of U per attempt:
+        #   0 attacker, 1 hit, 2 power roll, 3 damage variance,
+        #   4 knockdown/knockout roll, 5 TKO-after-knockdown roll
+        # One roll covers both outcomes: below kd_prob is a knockdown, the
+        # next ko_prob of the range is a knockout, anything above is neither.
         total_attempts = attempts_a + attempts_b
-        for _ in range(total_attempts):
-            a_att_prob = (spd_a * (1.0 - fatigue_a) + sta_a * 0.5) / (
-                (spd_a * (1.0 - fatigue_a) + sta_a * 0.5) +
-                (spd_b * (1.0 - fatigue_b) + sta_b * 0.5) + 1e-9
-            )
-            attacker_is_a = rng.random() < a_att_prob
-
-            if attacker_is_a:
-                # Hit probability factors: accuracy vs defense, freshness
-                hit_chance = _sigmoid(2.25 * ((acc_a - def_b) + 0.15 * (sta_a - fatigue_a) - 0.10 * (fatigue_b)))
-                hit_chance = max(0.15, min(0.75, hit_chance))
-                if rng.random() < hit_chance:
-                    landed_a += 1
-                    
-                    # --- FINAL TUNE: Damage (Reduced) & Defense (Increased) ---
-                    dmg = 0.5 + 2.5 * pow_a * (0.6 + 0.8 * rng.random()) - 3.5 * def_b
-                    dmg *= (1.0 + 0.15 * (1.0 - fatigue_a)) * (0.95 + 0.10 * rng.random())
-                    dmg = max(0.5, dmg) # Every landed punch does at least 0.5
-                    damage_b += dmg
-
-                    # --- Per-punch probabilities (from first fix) ---
-                    kd_prob = 0.001 + 0.0015 * pow_a + 0.0008 * max(0.0, (damage_b - 75.0) / 75.0)
-                    if rng.random() < kd_prob:
-                        kd_a += 1
-                        kd_total_b += 1
-                        notes.append(f"{a.name} scores a knockdown!")
-                        damage_b += 3 + 4 * pow_a
-
-                        if damage_b > ko_threshold_b * (0.85 + 0.10 * rng.random()):
-                            return _result_tko(a, b, rnd, pbp, landed_a, landed_b, kd_a, kd_b, judges, notes, rng)
-
-                    # --- Per-punch probabilities (from first fix) ---
-                    ko_prob = 0.0001 + 0.0015 * pow_a + 0.0008 * max(0.0, (damage_b - 90.0) / 60.0)
-                    if rng.random() < ko_prob:
-                        notes.append(f"{a.name} scores a knockout blow!")
-                        return _result_ko(a, b, rnd, pbp, landed_a, landed_b, kd_a, kd_b, judges, notes, rng)
+        U = rng.random((total_attempts, 6))
+
+        fresh_a = spd_a * (1.0 - fatigue_a) + sta_a * 0.5
+        fresh_b = spd_b * (1.0 - fatigue_b) + sta_b * 0.5
+        a_att_prob = fresh_a / (fresh_a + fresh_b + 1e-9)
+
+        # Hit probability factors: accuracy vs defense, freshness
+        hit_a = _hit_chance(2.25 * ((acc_a - def_b) + 0.15 * (sta_a - fatigue_a) - 0.10 * (fatigue_b)))
+        hit_b = _hit_chance(2.25 * ((acc_b - def_a) + 0.15 * (sta_b - fatigue_b) - 0.10 * (fatigue_a)))
+
+        # Knockdowns/knockouts are rare, so scan ahead for the next landed
+        # punch that triggers one, handle that punch here (a knockdown adds
+        # damage, which shifts every later probability), then resume the
+        # scan after it.
+        start = 0
+        while True:
+            i, damage[0], damage[1], n_a, n_b = next_event(
+                U, start, a_att_prob, hit_a, hit_b, pow_a, pow_b, def_a, def_b,
+                fatigue_a, fatigue_b, damage[0], damage[1])
+            landed_a += n_a
+            landed_b += n_b
+            if i >= total_attempts:
+                break
+
+            # Same rules whichever fighter threw the punch
+            atk = 0 if U[i, 0] < a_att_prob else 1
+            dfn = 1 - atk
+            attacker, defender = fighters[atk], fighters[dfn]
+
+            kd_prob_i = 0.001 + 0.0015 * power[atk] + 0.0008 * max(0.0, (damage[dfn] - 75.0) / 75.0)
+            if U[i, 4] < kd_prob_i:
+                kd[atk] += 1
+                kd_total[dfn] += 1
+                if record_notes:
+                    notes.append(f"{attacker.name} scores a knockdown!")
+                damage[dfn] += 3 + 4 * power[atk]
+                if damage[dfn] > tko_floor[dfn] and damage[dfn] > ko_threshold[dfn] * (0.85 + 0.10 * U[i, 5]):
+                    return _result_tko(attacker, defender, atk, rnd, pbp, landed_a, landed_b, kd[0], kd[1], notes, record_notes)
             else:
-                hit_chance = _sigmoid(2.25 * ((acc_b - def_a) + 0.15 * (sta_b - fatigue_b) - 0.10 * (fatigue_a)))
-                hit_chance = max(0.15, min(0.75, hit_chance))
-                if rng.random() < hit_chance:
-                    landed_b += 1
-
-                    # --- FINAL TUNE: Damage (Reduced) & Defense (Increased) ---
-                    dmg = 0.5 + 2.5 * pow_b * (0.6 + 0.8 * rng.random()) - 3.5 * def_a
-                    dmg *= (1.0 + 0.15 * (1.0 - fatigue_b)) * (0.95 + 0.10 * rng.random())
-                    dmg = max(0.5, dmg) # Every landed punch does at least 0.5
-                    damage_a += dmg
-
-                    # --- Per-punch probabilities (from first fix) ---
-                    kd_prob = 0.001 + 0.0015 * pow_b + 0.0008 * max(0.0, (damage_a - 75.0) / 75.0)
-                    if rng.random() < kd_prob:
-                        kd_b += 1
-                        kd_total_a += 1
-                        notes.append(f"{b.name} scores a knockdown!")
-                        damage_a += 3 + 4 * pow_b
-                        if damage_a > ko_threshold_a * (0.85 + 0.10 * rng.random()):
-                            return _result_tko(b, a, rnd, pbp, landed_a, landed_b, kd_a, kd_b, judges, notes, rng)
-
-                    # --- Per-punch probabilities (from first fix) ---
-                    ko_prob = 0.0001 + 0.0015 * pow_b + 0.0008 * max(0.0, (damage_a - 90.0) / 60.0)
-                    if rng.random() < ko_prob:
-                        notes.append(f"{b.name} scores a knockout blow!")
-                        return _result_ko(b, a, rnd, pbp, landed_a, landed_b, kd_a, kd_b, judges, notes, rng)
+                # The scan only stops under kd_prob + ko_prob: this is the KO share
+                if record_notes:
+                    notes.append(f"{attacker.name} scores a knockout blow!")
+                return _result_ko(attacker, defender, atk, rnd, pbp, landed_a, landed_b, kd[0], kd[1], notes, record_notes)
+
+            start = i + 1
+
+        # Both corner checks' draws in one call
+        corner_a, corner_b = rng.random(2).tolist()
 
         # Between-round TKO if someone took a beating
-        if damage_a > ko_threshold_a * (0.95 + 0.10 * rng.random()):
-            notes.append(f"Corner stops it for {a.name}.")
-            return _result_tko(b, a, rnd, pbp, landed_a, landed_b, kd_a, kd_b, judges, notes, rng)
-        if damage_b > ko_threshold_b * (0.95 + 0.10 * rng.random()):
-            notes.append(f"Corner stops it for {b.name}.")
-            return _result_tko(a, b, rnd, pbp, landed_a, landed_b, kd_a, kd_b, judges, notes, rng)
-
-        # Capture per-judge scores for this round
-        round_score_cards: List[str] = []
-
-        # Judges score the round (three judges with tiny noise)
-        for j in range(3):
-            bias = (rng.random() - 0.5) * 0.4  # small lean
-            a_pts, b_pts = _score_round(landed_a, landed_b, kd_a, kd_b, judge_bias=bias)
-            judges[j][0] += a_pts
-            judges[j][1] += b_pts
-            round_score_cards.append(f"{int(a_pts)}-{int(b_pts)}")
-
-        pbp.append({
-            "round": rnd,
-            "landed_a": landed_a,
-            "landed_b": landed_b,
-            "kd_a": kd_a,
-            "kd_b": kd_b,
-            "notes": notes,
-            "judge_scores": round_score_cards
-        })
+        if damage[0] > ko_threshold_a * (0.95 + 0.10 * corner_a):
+            if record_notes:
+                notes.append(f"Corner stops it for {a.name}.")
+            return _result_tko(b, a, 1, rnd, pbp, landed_a, landed_b, kd[0], kd[1], notes, record_notes)
+        if damage[1] > ko_threshold_b * (0.95 + 0.10 * corner_b):
+            if record_notes:
+                notes.append(f"Corner stops it for {b.name}.")
+            return _result_tko(a, b, 0, rnd, pbp, landed_a, landed_b, kd[0], kd[1], notes, record_notes)
+
+        # Judges score the round. A judge's lean would be under 0.2, and
+        # landed counts are whole numbers, so no lean could carry the margin
+        # across +-0.5: the three judges always agree, so score once.
+        a_pts, b_pts = _score_round(landed_a, landed_b, kd[0], kd[1])
+        total_a += a_pts
+        total_b += b_pts
+        round_score_cards = [_CARDS[a_pts, b_pts]] * 3 if record_notes else []
+
+        pbp.record(landed_a, landed_b, kd[0], kd[1], notes, round_score_cards)
 
         # Increased Fatigue
         total_landed = max(1, landed_a + landed_b)
@@ -197,9 +340,6 @@ def simulate_fight(a: Fighter, b: Fighter, rounds: int = 12, seed: Optional[int]
         fatigue_b += 0.055 + 0.025 * (landed_a / total_landed)
         
         # Fatigue Recovery between rounds based on stamina
-        fatigue_recovery_a = 0.01 + 0.03 * sta_a
-        fatigue_recovery_b = 0.01 + 0.03 * sta_b
-        
         fatigue_a = max(0.0, fatigue_a - fatigue_recovery_a)
         fatigue_b = max(0.0, fatigue_b - fatigue_recovery_b)
 
@@ -211,7 +351,7 @@ def simulate_fight(a: Fighter, b: Fighter, rounds: int = 12, seed: Optional[int]
     cards: List[str] = []
     a_cards = 0
     b_cards = 0
-    for (ja, jb) in judges:
+    for (ja, jb) in ((total_a, total_b),) * 3:
         cards.append(f"{int(ja)}-{int(jb)}")
         if ja > jb:
             a_cards += 1
@@ -222,24 +362,28 @@ def simulate_fight(a: Fighter, b: Fighter, rounds: int = 12, seed: Optional[int]
         verdict = "Unanimous Decision" if a_cards == 3 else ("Split Decision" if b_cards == 1 else "Majority Decision")
         winner = {"boxer_id": a.boxer_id, "name": a.name}
         loser = {"boxer_id": b.boxer_id, "name": b.name}
+        side = 0
     elif b_cards > a_cards:
         verdict = "Unanimous Decision" if b_cards == 3 else ("Split Decision" if a_cards == 1 else "Majority Decision")
         winner = {"boxer_id": b.boxer_id, "name": b.name}
         loser = {"boxer_id": a.boxer_id, "name": a.name}
+        side = 1
     else:
         verdict = "Draw"
         winner = None
         loser = None
+        side = None
 
     return {
         "result": {"type": "Decision", "verdict": verdict, "cards": cards},
         "winner": winner,
         "loser": loser,
+        "winner_side": side,
         "totals": {
-            "damage_to_a": round(damage_a, 2),
-            "damage_to_b": round(damage_b, 2),
-            "kd_suffered_a": kd_total_a,
-            "kd_suffered_b": kd_total_b,
+            "damage_to_a": round(damage[0], 2),
+            "damage_to_b": round(damage[1], 2),
+            "kd_suffered_a": kd_total[0],
+            "kd_suffered_b": kd_total[1],
             "fatigue_a": round(fatigue_a, 2),
             "fatigue_b": round(fatigue_b, 2),
         },
@@ -248,60 +392,103 @@ def simulate_fight(a: Fighter, b: Fighter, rounds: int = 12, seed: Optional[int]
 
 # -------- Result builders --------
 
-def _result_tko(winner: Fighter, loser: Fighter, rnd: int,
-                pbp: List[Dict[str, Any]],
+def _result_tko(winner: Fighter, loser: Fighter, side: int, rnd: int,
+                pbp: PlayByPlay,
                 landed_a: int, landed_b: int, kd_a: int, kd_b: int,
-                judges, notes: List[str], rng: random.Random) -> Dict[str, Any]:
+                notes: List[str], record_notes: bool) -> Dict[str, Any]:
     
     # Score the final, interrupted round
-    round_score_cards: List[str] = []
-    for j in range(3):
-        bias = (rng.random() - 0.5) * 0.4
-        a_pts, b_pts = _score_round(landed_a, landed_b, kd_a, kd_b, judge_bias=bias)
-        round_score_cards.append(f"{int(a_pts)}-{int(b_pts)}")
-
-    pbp.append({
-        "round": rnd,
-        "stoppage": True,
-        "landed_a": landed_a,
-        "landed_b": landed_b,
-        "kd_a": kd_a,
-        "kd_b": kd_b,
-        "notes": notes + [f"Referee stops the fight. {winner.name} wins by TKO."],
-        "judge_scores": round_score_cards
-    })
+    # One card for all three judges (see simulate_fight)
+    a_pts, b_pts = _score_round(landed_a, landed_b, kd_a, kd_b)
+    round_score_cards = [_CARDS[a_pts, b_pts]] * 3 if record_notes else []
+
+    pbp.record(landed_a, landed_b, kd_a, kd_b,
+               notes + [f"Referee stops the fight. {winner.name} wins by TKO."] if record_notes else notes,
+               round_score_cards)
+    pbp.stopped = True
     return {
         "result": {"type": "TKO", "round": rnd},
         "winner": {"boxer_id": winner.boxer_id, "name": winner.name},
         "loser": {"boxer_id": loser.boxer_id, "name": loser.name},
+        "winner_side": side,
         "play_by_play": pbp
     }
 
-def _result_ko(winner: Fighter, loser: Fighter, rnd: int,
-               pbp: List[Dict[str, Any]],
+def _result_ko(winner: Fighter, loser: Fighter, side: int, rnd: int,
+               pbp: PlayByPlay,
                landed_a: int, landed_b: int, kd_a: int, kd_b: int,
-               judges, notes: List[str], rng: random.Random) -> Dict[str, Any]:
+               notes: List[str], record_notes: bool) -> Dict[str, Any]:
 
     # Score the final, interrupted round
-    round_score_cards: List[str] = []
-    for j in range(3):
-        bias = (rng.random() - 0.5) * 0.4
-        a_pts, b_pts = _score_round(landed_a, landed_b, kd_a, kd_b, judge_bias=bias)
-        round_score_cards.append(f"{int(a_pts)}-{int(b_pts)}")
-        
-    pbp.append({
-        "round": rnd,
-        "stoppage": True,
-        "landed_a": landed_a,
-        "landed_b": landed_b,
-        "kd_a": kd_a,
-        "kd_b": kd_b,
-        "notes": notes + [f"{winner.name} wins by KO!"],
-        "judge_scores": round_score_cards
-    })
+    # One card for all three judges (see simulate_fight)
+    a_pts, b_pts = _score_round(landed_a, landed_b, kd_a, kd_b)
+    round_score_cards = [_CARDS[a_pts, b_pts]] * 3 if record_notes else []
+
+    pbp.record(landed_a, landed_b, kd_a, kd_b,
+               notes + [f"{winner.name} wins by KO!"] if record_notes else notes,
+               round_score_cards)
+    pbp.stopped = True
     return {
         "result": {"type": "KO", "round": rnd},
-        "winner": {"box...b" : winner.boxer_id, "name": winner.name},
+        "winner": {"boxer_id": winner.boxer_id, "name": winner.name},
         "loser": {"boxer_id": loser.boxer_id, "name": loser.name},
+        "winner_side": side,
         "play_by_play": pbp
-    }
\ No newline at end of file
+    }
+
+# -------- Batch --------
+
+def _simulate_chunk(a: Fighter, b: Fighter, rounds: int, seeds: range) -> np.ndarray:
+    """Outcome code per fight: 0 = A wins, 1 = B wins, 2 = draw."""
+    out = np.empty(len(seeds), dtype=np.intp)
+    for k, s in enumerate(seeds):
+        # By side, not boxer_id: a mirror matchup has the same id in both corners
+        side = _simulate_fight(a, b, rounds, s, False)["winner_side"]
+        out[k] = 2 if side is None else side
+    return out
+
+def simulate_many(a: Fighter, b: Fighter, n: int, seed: Optional[int] = None,
+                  rounds: int = 12, workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Simulate n independent fights of a vs b across processes.
+    Fight i uses seed + i, so it matches simulate_fight(a, b, seed=seed + i).
+    """
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy) & 0x7FFFFFFFFFFFFFFF
+    seeds = range(seed, seed + n)
+    workers = min(workers or os.cpu_count() or 1, n)
+
+    if workers <= 1:
+        codes = _simulate_chunk(a, b, rounds, seeds)
+    else:
+        size = -(-n // workers)
+        chunks = [seeds[i:i + size] for i in range(0, n, size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            codes = np.concatenate(list(pool.map(_simulate_chunk, repeat(a), repeat(b), repeat(rounds), chunks)))
+
+    wins_a, wins_b, draws = (int(c) for c in np.bincount(codes, minlength=3))
+    return {
+        "fights": n,
+        "wins_a": wins_a,
+        "wins_b": wins_b,
+        "draws": draws,
+        "win_pct_a": round(100.0 * wins_a / n, 2) if n else 0.0,
+    }
+
+def simulate_fights_mp(fight_specs: List[Tuple[Fighter, Fighter]], rounds: int = 12,
+                       seed: Optional[int] = None, processes: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Simulate each (a, b) pair in fight_specs across processes and return the
+    simulate_fight results in the same order. Per-fight seeds are spawned
+    from seed, so a given seed reproduces the whole batch.
+    """
+    seeds = [int(s.generate_state(1, np.uint64)[0]) for s in np.random.SeedSequence(seed).spawn(len(fight_specs))]
+    fighters_a = [a for a, _ in fight_specs]
+    fighters_b = [b for _, b in fight_specs]
+    workers = processes or os.cpu_count() or 1
+    if workers <= 1 or len(fight_specs) <= 1:
+        return list(map(simulate_fight, fighters_a, fighters_b, repeat(rounds), seeds))
+    # ~4 chunks per worker: few enough pickling round-trips, enough to balance load
+    chunksize = max(1, len(fight_specs) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(simulate_fight, fighters_a, fighters_b, repeat(rounds), seeds, chunksize=chunksize))
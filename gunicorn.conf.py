@@ -0,0 +1,23 @@
+# gunicorn.conf.py — picked up automatically when gunicorn starts from the
+# project root (CLI flags still take precedence).
+#
+# Threaded workers: a request waiting on Postgres only parks its own thread,
+# so the other threads keep serving /sim/fight and the pages meanwhile.
+# Keep workers * threads within what the DB allows, since each worker has its
+# own connection pool (see db.py).
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+worker_class = "gthread"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+
+def post_fork(server, worker):
+    # Runs in each worker before the app (and db.py's pool) is imported.
+    # Default the pool max to the worker's real thread count, including
+    # --threads from the CLI, so threads don't queue for a connection.
+    # An explicit DB_POOL_MAX (env or .env) still takes precedence.
+    os.environ["DB_POOL_MAX_DEFAULT"] = str(
+        max(worker.cfg.threads, 2 * (os.cpu_count() or 1))
+    )
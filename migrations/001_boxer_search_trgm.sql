@@ -0,0 +1,23 @@
+-- 001_boxer_search_trgm.sql
+-- Indexable substring search for /boxers?q=...
+--
+-- LOWER(col) LIKE '%x%' can't use a btree index, so every search was a
+-- sequential scan. Boxer names are folded into one generated column with a
+-- trigram GIN index (pg_trgm serves LIKE '%x%' from the index), stable names
+-- get their own trigram index, and boxer.stable_id gets a btree index so the
+-- stable-name branch of the search can be answered by an index lookup too.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public;
+
+ALTER TABLE boxing.boxer
+    ADD COLUMN IF NOT EXISTS search_text text
+    GENERATED ALWAYS AS (lower(first_name || ' ' || last_name)) STORED;
+
+CREATE INDEX IF NOT EXISTS ix_boxer_search_trgm
+    ON boxing.boxer USING gin (search_text public.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_stable_name_trgm
+    ON boxing.stable USING gin (lower(name::text) public.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_boxer_stable
+    ON boxing.boxer USING btree (stable_id);
@@ -0,0 +1,17 @@
+-- 002_mv_dashboard_counts.sql
+-- Pre-aggregated dashboard counters.
+--
+-- The dashboard read four COUNT(*)s (full scans) on every hit; this moved
+-- them into a one-row materialized view. Superseded by
+-- 004_dashboard_counts.sql, which keeps the counts in boxing.dashboard_counts
+-- and drops this view.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS boxing.mv_dashboard_counts AS
+SELECT 1 AS id,
+       (SELECT COUNT(*) FROM boxing.weight_class) AS classes,
+       (SELECT COUNT(*) FROM boxing.title)        AS titles,
+       (SELECT COUNT(*) FROM boxing.boxer)        AS boxers,
+       (SELECT COUNT(*) FROM boxing.boxing_card)  AS cards;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_dashboard_counts
+    ON boxing.mv_dashboard_counts (id);
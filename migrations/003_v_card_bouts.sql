@@ -0,0 +1,22 @@
+-- 003_v_card_bouts.sql
+-- Per-bout rows for the card detail page, one row per bout.
+--
+-- Same shape the /cards/<id> route used to build inline; as a view it sits
+-- next to v_cards_summary and lets the route fetch card + bouts in one query.
+
+CREATE OR REPLACE VIEW boxing.v_card_bouts AS
+SELECT
+    bo.card_id,
+    bo.bout_id, bo.bout_order, bo.main_event,
+    wc.name AS weight_class, t.title_name,
+    MAX(bx.first_name || ' ' || bx.last_name) FILTER (WHERE bp.corner = 'A') AS fighter_a,
+    MAX(bx.first_name || ' ' || bx.last_name) FILTER (WHERE bp.corner = 'B') AS fighter_b,
+    MAX(bx.first_name || ' ' || bx.last_name) FILTER (WHERE bp.result = 'win') AS winner,
+    MAX(bp.method::text)                        FILTER (WHERE bp.result = 'win') AS method,
+    MAX(bp.round_ended)                         FILTER (WHERE bp.result = 'win') AS round
+FROM boxing.bout bo
+JOIN boxing.weight_class     wc ON wc.weight_class_id = bo.weight_class_id
+LEFT JOIN boxing.title        t ON t.title_id = bo.title_id
+JOIN boxing.bout_participant bp ON bp.bout_id = bo.bout_id
+JOIN boxing.boxer            bx ON bx.boxer_id = bp.boxer_id
+GROUP BY bo.card_id, bo.bout_id, bo.bout_order, bo.main_event, wc.name, t.title_name;
@@ -0,0 +1,88 @@
+-- 004_dashboard_counts.sql
+-- Dashboard counters kept by the writes themselves.
+--
+-- Replaces boxing.mv_dashboard_counts (002): refreshing the view from a
+-- trigger took an ACCESS EXCLUSIVE lock on it inside every writer's
+-- transaction, re-ran all four COUNT(*)s per insert and needed the writing
+-- role to own the view. Instead, boxing.dashboard_counts holds one row per
+-- counted table and statement-level triggers add each statement's inserted /
+-- deleted row count (from its transition table) to that table's row, so
+-- writers to different tables never touch the same row.
+--
+-- The trigger function is SECURITY DEFINER with a pinned search_path, so the
+-- app role needs no privileges on the counts table. Writes are locked out
+-- while the counts are seeded so none slip between the seed and the triggers.
+
+BEGIN;
+
+LOCK TABLE boxing.weight_class, boxing.title, boxing.boxer, boxing.boxing_card
+    IN SHARE ROW EXCLUSIVE MODE;
+
+CREATE TABLE IF NOT EXISTS boxing.dashboard_counts (
+    tbl text PRIMARY KEY,
+    n   bigint NOT NULL
+);
+
+INSERT INTO boxing.dashboard_counts (tbl, n)
+          SELECT 'weight_class', COUNT(*) FROM boxing.weight_class
+UNION ALL SELECT 'title',        COUNT(*) FROM boxing.title
+UNION ALL SELECT 'boxer',        COUNT(*) FROM boxing.boxer
+UNION ALL SELECT 'boxing_card',  COUNT(*) FROM boxing.boxing_card
+ON CONFLICT (tbl) DO UPDATE SET n = EXCLUDED.n;
+
+CREATE OR REPLACE FUNCTION boxing.bump_dashboard_counts()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = pg_catalog, pg_temp
+AS $$
+DECLARE
+    delta bigint;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        UPDATE boxing.dashboard_counts SET n = 0 WHERE tbl = TG_TABLE_NAME;
+        RETURN NULL;
+    ELSIF TG_OP = 'INSERT' THEN
+        SELECT COUNT(*) INTO delta FROM new_rows;
+    ELSE
+        SELECT -COUNT(*) INTO delta FROM old_rows;
+    END IF;
+    IF delta <> 0 THEN
+        UPDATE boxing.dashboard_counts SET n = n + delta WHERE tbl = TG_TABLE_NAME;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+REVOKE ALL ON FUNCTION boxing.bump_dashboard_counts() FROM PUBLIC;
+
+-- A trigger with a transition table can only fire on one event, hence three
+-- per counted table.
+DO $$
+DECLARE
+    t text;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['weight_class', 'title', 'boxer', 'boxing_card'] LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_dashboard_counts ON boxing.%I', t);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_dashboard_counts_ins ON boxing.%I', t);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_dashboard_counts_del ON boxing.%I', t);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_dashboard_counts_trunc ON boxing.%I', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_dashboard_counts_ins AFTER INSERT ON boxing.%I '
+            'REFERENCING NEW TABLE AS new_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION boxing.bump_dashboard_counts()', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_dashboard_counts_del AFTER DELETE ON boxing.%I '
+            'REFERENCING OLD TABLE AS old_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION boxing.bump_dashboard_counts()', t);
+        EXECUTE format(
+            'CREATE TRIGGER trg_dashboard_counts_trunc AFTER TRUNCATE ON boxing.%I '
+            'FOR EACH STATEMENT EXECUTE FUNCTION boxing.bump_dashboard_counts()', t);
+    END LOOP;
+END;
+$$;
+
+DROP FUNCTION IF EXISTS boxing.refresh_mv_dashboard_counts();
+DROP MATERIALIZED VIEW IF EXISTS boxing.mv_dashboard_counts;
+
+COMMIT;